@@ -52,12 +52,23 @@ Usage:
     info = dmidecode.get_hardware_info()
 """
 
+import copy
+import functools
+import hashlib
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import os
+import re
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from _dmidecode import *
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up module logger
 logger = logging.getLogger(__name__)
 
@@ -186,6 +197,9 @@ OEM_TYPES = {
     222: "OEM Hardware Features",
 }
 
+# Combined type ID to name lookup used by get_type_name()
+_ALL_TYPE_NAMES = {**DMI_TYPES, **OEM_TYPES}
+
 # DMI Section names and their included types
 DMI_SECTIONS = {
     'bios': (0, 13, 45),
@@ -245,48 +259,154 @@ def log_messages() -> None:
     Log any warnings and debug messages from the last dmidecode operation.
     This is called automatically if enable_auto_logging() has been called.
     """
+    # Each batch of messages is emitted as a single multi-line record
     warnings = get_warnings()
     if warnings:
-        for line in warnings.strip().split('\n'):
-            if line.strip():
-                logger.warning(line.strip())
+        message = _join_message_lines(warnings)
+        if message:
+            logger.warning(message)
         clear_warnings()
 
     debug_msgs = get_debug()
     if debug_msgs:
-        for line in debug_msgs.strip().split('\n'):
-            if line.strip():
-                logger.debug(line.strip())
+        message = _join_message_lines(debug_msgs)
+        if message:
+            logger.debug(message)
         clear_debug()
 
 
+def _join_message_lines(messages: str) -> str:
+    """Strip each line of a message buffer and drop the blank ones."""
+    return '\n'.join(line.strip() for line in messages.split('\n') if line.strip())
+
+
 def _auto_log_wrapper(func):
     """Decorator to automatically log messages after function calls if enabled."""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         result = func(*args, **kwargs)
         if _auto_log_enabled:
             log_messages()
         return result
-    wrapper.__name__ = func.__name__
-    wrapper.__doc__ = func.__doc__
     return wrapper
 
 
 # Store original functions
 _QuerySection_orig = QuerySection
 _QueryTypeId_orig = QueryTypeId
+_QueryAllTypes_orig = QueryAllTypes
 _dump_orig = dump
+_set_dev_orig = set_dev
+_pythonmap_orig = pythonmap
+
+# =============================================================================
+# Query Result Cache
+# =============================================================================
+
+# DMI data does not change while the process is running, so every section and
+# type ID only needs to be decoded once.  The cache is dropped whenever the
+# data source or the XML->Python mapping changes.
+_cached_query_section = functools.lru_cache(maxsize=512)(_QuerySection_orig)
+_cached_query_type = functools.lru_cache(maxsize=512)(_QueryTypeId_orig)
+_cached_query_all_types = functools.lru_cache(maxsize=1)(_QueryAllTypes_orig)
+
+
+def invalidate_dmi_cache() -> None:
+    """
+    Discard all cached QuerySection(), QueryTypeId() and QueryAllTypes() results.
+
+    This is done automatically by set_dev() and pythonmap().  Call it manually
+    if the underlying dump file has been rewritten in place.
+    """
+    _cached_query_section.cache_clear()
+    _cached_query_type.cache_clear()
+    _cached_query_all_types.cache_clear()
+
+
+# True once set_dev() has selected a dump file.  The default device may itself
+# be a regular file (/sys/firmware/dmi/tables/DMI on EFI systems), so this
+# cannot be told from get_dev() alone.
+_dump_file_selected = False
+
+
+def set_dev(device):
+    """Set an alternative memory device file and invalidate cached DMI data."""
+    global _dump_file_selected
+    invalidate_dmi_cache()
+    result = _set_dev_orig(device)
+    # The extension only returns to the live tables for /dev/mem; any other
+    # accepted path is read as a dump file
+    _dump_file_selected = os.fsdecode(device) != '/dev/mem'
+    return result
+
+
+# Mapping file set through pythonmap(), None while the built-in default is used
+_pythonmap_file = None
+
+
+def pythonmap(filename):
+    """Use another XML->Python mapping file and invalidate cached DMI data."""
+    global _pythonmap_file
+    invalidate_dmi_cache()
+    _pythonmap_file = filename
+    return _pythonmap_orig(filename)
+
+
+def _copy_result(func):
+    """Decorator returning a deep copy of a cached result, so callers may modify it."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return copy.deepcopy(func(*args, **kwargs))
+    return wrapper
+
+
+# Cached queries for use inside this module.  The results are shared and must
+# not be modified; _decode_bytes() and _prepare_for_json() build new objects.
+_logged_query_section = _auto_log_wrapper(_cached_query_section)
+_logged_query_type = _auto_log_wrapper(_cached_query_type)
 
 # Wrap the main query functions with auto-logging
-QuerySection = _auto_log_wrapper(_QuerySection_orig)
-QueryTypeId = _auto_log_wrapper(_QueryTypeId_orig)
+QuerySection = _copy_result(_logged_query_section)
+QueryTypeId = _copy_result(_logged_query_type)
+QueryAllTypes = _copy_result(_auto_log_wrapper(_cached_query_all_types))
 dump = _auto_log_wrapper(_dump_orig)
 
 
+def _query_all_types() -> Dict[int, Dict]:
+    """
+    Get the data of every DMI type ID present, decoded in a single C call.
+
+    Returns:
+        Dictionary mapping each type ID that has data to its raw query result,
+        or an empty dictionary if the DMI data cannot be decoded
+    """
+    try:
+        found = _cached_query_all_types()
+    except Exception:
+        found = {}
+    if _auto_log_enabled:
+        log_messages()
+    return found
+
+
+def _query_type(type_id: int) -> Dict:
+    """
+    Query a single DMI type ID.
+
+    Once QueryAllTypes() has been decoded for the current data source, the
+    answer is taken from it, so types absent from the DMI table cost a
+    dictionary lookup instead of another walk of the table.
+    """
+    if _cached_query_all_types.cache_info().currsize:
+        return _cached_query_all_types().get(type_id, {})
+    return _logged_query_type(type_id)
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=256)
 def get_type_name(type_id: int) -> str:
     """
     Get the human-readable name for a DMI type ID.
@@ -297,10 +417,9 @@ def get_type_name(type_id: int) -> str:
     Returns:
         Human-readable type name
     """
-    if type_id in DMI_TYPES:
-        return DMI_TYPES[type_id]
-    elif type_id in OEM_TYPES:
-        return OEM_TYPES[type_id]
+    name = _ALL_TYPE_NAMES.get(type_id)
+    if name is not None:
+        return name
     elif 128 <= type_id <= 255:
         return f"OEM Type {type_id}"
     elif 47 <= type_id <= 127:
@@ -336,20 +455,40 @@ def is_standard_type(type_id: int) -> bool:
 
 
 
+# Converters for _decode_bytes() and _prepare_for_json(), keyed by the exact
+# class of the value; None leaves the value unchanged.  The extension only
+# ever builds these classes, so a single dict lookup finds the converter;
+# subclasses go through _converter_for().  (The builtin type() is shadowed
+# by the extension's type() query function, hence __class__.)
+
+def _converter_for(converters: Dict[Any, Any], obj: Any, default: Any = None) -> Any:
+    """Find the converter of the first class in converters that obj is an instance of."""
+    for cls, convert in converters.items():
+        if isinstance(obj, cls):
+            return convert
+    return default
+
+
 def _decode_bytes(obj: Any) -> Any:
     """Recursively decode byte strings to regular strings."""
-    if isinstance(obj, bytes):
-        try:
-            return obj.decode('utf-8', errors='replace')
-        except Exception:
-            return str(obj)
-    elif isinstance(obj, dict):
-        return {_decode_bytes(k): _decode_bytes(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_decode_bytes(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(_decode_bytes(item) for item in obj)
-    return obj
+    try:
+        convert = _DECODE_BYTES_CONVERTERS[obj.__class__]
+    except KeyError:
+        convert = _converter_for(_DECODE_BYTES_CONVERTERS, obj)
+    return obj if convert is None else convert(obj)
+
+
+_DECODE_BYTES_CONVERTERS = {
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    None.__class__: None,
+    bytes: lambda obj: obj.decode('utf-8', errors='replace'),
+    dict: lambda obj: {_decode_bytes(k): _decode_bytes(v) for k, v in obj.items()},
+    list: lambda obj: [_decode_bytes(item) for item in obj],
+    tuple: lambda obj: tuple(_decode_bytes(item) for item in obj),
+}
 
 
 # =============================================================================
@@ -367,7 +506,7 @@ def query_oem_type(type_id: int) -> Optional[Dict]:
         Dictionary with DMI data, or None if type doesn't exist
     """
     try:
-        data = QueryTypeId(type_id)
+        data = _query_type(type_id)
         clear_warnings()
         if data:
             return _decode_bytes(data)
@@ -387,7 +526,7 @@ def query_type_with_fallback(type_id: int) -> Optional[Dict]:
         Dictionary with DMI data, or None if type doesn't exist
     """
     try:
-        data = QueryTypeId(type_id)
+        data = _query_type(type_id)
         if data:
             return _decode_bytes(data)
     except Exception:
@@ -399,22 +538,99 @@ def query_type_with_fallback(type_id: int) -> Optional[Dict]:
 # JSON Export Functions
 # =============================================================================
 
-def _make_json_serializable(obj: Any) -> Any:
-    """Convert an object to a JSON-serializable format."""
-    if isinstance(obj, bytes):
-        try:
-            return obj.decode('utf-8', errors='replace')
-        except Exception:
-            return obj.hex()
-    elif isinstance(obj, dict):
-        return {str(k): _make_json_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [_make_json_serializable(item) for item in obj]
-    elif hasattr(obj, '__dict__'):
-        return _make_json_serializable(obj.__dict__)
+# Identifies the encoder in the disk cache key, see _disk_cache_path()
+_JSON_SERIALIZER = ('orjson', orjson.__version__) if orjson is not None else ('json',)
+
+
+def _json_options(pretty: bool) -> Dict[str, Any]:
+    """
+    Get the json module options that give orjson's formatting.
+
+    orjson writes compact separators, two-space indentation and raw UTF-8,
+    and offers no options to change that, so the standard library encoder
+    is set up to match it instead.
+    """
+    return {
+        'indent': 2 if pretty else None,
+        'separators': (',', ': ') if pretty else (',', ':'),
+        'ensure_ascii': False,
+        'default': str,
+    }
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise.  Both produce the same text.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option, default=str).decode('utf-8')
+    return json.dumps(obj, **_json_options(pretty))
+
+
+def _dump_file(obj: Any, filepath: str, pretty: bool = False) -> None:
+    """
+    Serialize an object as JSON straight into a file.
+
+    Unlike writing the result of _dumps(), this never holds the document as
+    an intermediate str: orjson's bytes are written as-is and the standard
+    library encoder streams its chunks to the file.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option, default=str))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, **_json_options(pretty))
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dictionary key to a JSON object key, decoding byte strings."""
+    if isinstance(key, bytes):
+        return key.decode('utf-8', errors='replace')
+    return str(key)
+
+
+def _prepare_for_json(obj: Any) -> Any:
+    """
+    Decode byte strings and convert an object to a JSON-serializable format.
+
+    This does the work of _decode_bytes() followed by a JSON conversion in a
+    single traversal, so query results are only copied once.
+    """
+    try:
+        convert = _JSON_CONVERTERS[obj.__class__]
+    except KeyError:
+        convert = _converter_for(_JSON_CONVERTERS, obj, _object_to_json)
+    return obj if convert is None else convert(obj)
+
+
+def _object_to_json(obj: Any) -> Any:
+    """Convert an object of any other class by its attributes, if it has any."""
+    if hasattr(obj, '__dict__'):
+        return _prepare_for_json(obj.__dict__)
     return obj
 
 
+_JSON_CONVERTERS = {
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    None.__class__: None,
+    bytes: lambda obj: obj.decode('utf-8', errors='replace'),
+    # Most keys are already str; only convert the others
+    dict: lambda obj: {k if k.__class__ is str else _json_key(k): _prepare_for_json(v)
+                       for k, v in obj.items()},
+    list: lambda obj: [_prepare_for_json(item) for item in obj],
+    tuple: lambda obj: [_prepare_for_json(item) for item in obj],
+}
+
+
 def get_section_json(section: str, pretty: bool = False) -> str:
     """
     Get DMI section data as JSON string.
@@ -427,12 +643,10 @@ def get_section_json(section: str, pretty: bool = False) -> str:
         JSON string
     """
     try:
-        data = QuerySection(section)
-        data = _make_json_serializable(_decode_bytes(data))
-        indent = 2 if pretty else None
-        return json.dumps(data, indent=indent, default=str)
+        data = _prepare_for_json(_logged_query_section(section))
+        return _dumps(data, pretty)
     except Exception as e:
-        return json.dumps({'error': str(e)})
+        return _dumps({'error': str(e)})
 
 
 def get_type_json(type_id: int, pretty: bool = False) -> str:
@@ -447,27 +661,124 @@ def get_type_json(type_id: int, pretty: bool = False) -> str:
         JSON string
     """
     try:
-        data = query_type_with_fallback(type_id)
+        data = _logged_query_type(type_id)
+    except Exception:
+        data = None
+
+    try:
         if data:
-            data = _make_json_serializable(data)
-            indent = 2 if pretty else None
-            return json.dumps(data, indent=indent, default=str)
-        return json.dumps({})
+            return _dumps(_prepare_for_json(data), pretty)
+        return _dumps({})
     except Exception as e:
-        return json.dumps({'error': str(e)})
+        return _dumps({'error': str(e)})
 
 
-def get_all_json(include_oem: bool = False, pretty: bool = False) -> str:
+# Opt-in persistent cache for get_all_json(), see _disk_cache_path()
+_DISK_CACHE_ENV = 'DMIDECODE_DISK_CACHE'
+_SYSFS_DMI_TABLES = '/sys/firmware/dmi/tables'
+
+
+def _disk_cache_path(*options: Any) -> Optional[str]:
     """
-    Get all DMI data as JSON string.
+    Get the on-disk cache file for the current data source.
+
+    The cache is only used when DMIDECODE_DISK_CACHE=1.  The file name is a
+    hash of the raw DMI table (the dump file set with set_dev(), or the
+    kernel's copy in /sys/firmware/dmi/tables), the mapping file, the module
+    version, the JSON encoder and the given options, so a firmware update
+    or a different dump never hits a stale entry.
 
     Args:
+        options: Values that change the cached output (e.g. include_oem)
+
+    Returns:
+        Path of the cache file, or None if the cache is disabled or the
+        table cannot be read
+    """
+    if os.environ.get(_DISK_CACHE_ENV) != '1':
+        return None
+
+    if _dump_file_selected:
+        sources = [get_dev()]
+    else:
+        sources = [os.path.join(_SYSFS_DMI_TABLES, 'smbios_entry_point'),
+                   os.path.join(_SYSFS_DMI_TABLES, 'DMI')]
+    if _pythonmap_file:
+        sources.append(_pythonmap_file)
+
+    digest = hashlib.sha256(repr((version, _JSON_SERIALIZER) + options).encode('utf-8'))
+    try:
+        for path in sources:
+            with open(path, 'rb') as f:
+                content = f.read()
+            digest.update(b'%d:' % len(content))
+            digest.update(content)
+    except OSError:
+        return None
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'python-dmidecode', digest.hexdigest() + '.json')
+
+
+def _read_disk_cache(path: str) -> Optional[str]:
+    """Read a cached JSON document, or return None on a miss."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_disk_cache(path: str, data: str) -> None:
+    """Atomically store a JSON document in the on-disk cache."""
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug(f"Failed to write DMI cache {path}: {e}")
+
+
+def _cached_all_json(cache_path: str, include_oem: bool, pretty: bool) -> str:
+    """
+    Get the get_all_json() document from the on-disk cache.
+
+    On a miss the document is built and stored in the cache.
+
+    Args:
+        cache_path: Cache file, as returned by _disk_cache_path()
         include_oem: Whether to include OEM types (128-255)
         pretty: Whether to format with indentation
 
     Returns:
         JSON string with all DMI data
     """
+    cached = _read_disk_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    result = _dumps(_build_all_data(include_oem), pretty)
+    _write_disk_cache(cache_path, result)
+    return result
+
+
+def _build_all_data(include_oem: bool = False) -> Dict[str, Dict]:
+    """
+    Collect all sections and types as JSON-ready data.
+
+    Args:
+        include_oem: Whether to include OEM types (128-255)
+
+    Returns:
+        Dictionary with 'sections' and 'types' keys
+    """
     all_data = {
         'sections': {},
         'types': {}
@@ -476,33 +787,37 @@ def get_all_json(include_oem: bool = False, pretty: bool = False) -> str:
     # Get all sections
     for section in DMI_SECTIONS.keys():
         try:
-            data = QuerySection(section)
+            data = _cached_query_section(section)
             if data:
-                all_data['sections'][section] = _make_json_serializable(_decode_bytes(data))
+                all_data['sections'][section] = _prepare_for_json(data)
         except Exception:
             pass
+    if _auto_log_enabled:
+        log_messages()
 
-    # Get standard types
-    for type_id in range(128):
-        try:
-            data = QueryTypeId(type_id)
-            if data:
-                all_data['types'][str(type_id)] = _make_json_serializable(_decode_bytes(data))
-        except Exception:
-            pass
+    # Get standard types, plus OEM types if requested
+    for type_id, data in _query_all_types().items():
+        if type_id < 128 or include_oem:
+            all_data['types'][str(type_id)] = _prepare_for_json(data)
 
-    # Get OEM types if requested
-    if include_oem:
-        for type_id in range(128, 256):
-            try:
-                data = query_oem_type(type_id)
-                if data:
-                    all_data['types'][str(type_id)] = _make_json_serializable(data)
-            except Exception:
-                pass
+    return all_data
+
+
+def get_all_json(include_oem: bool = False, pretty: bool = False) -> str:
+    """
+    Get all DMI data as JSON string.
+
+    Args:
+        include_oem: Whether to include OEM types (128-255)
+        pretty: Whether to format with indentation
 
-    indent = 2 if pretty else None
-    return json.dumps(all_data, indent=indent, default=str)
+    Returns:
+        JSON string with all DMI data
+    """
+    cache_path = _disk_cache_path('all', include_oem, pretty)
+    if cache_path:
+        return _cached_all_json(cache_path, include_oem, pretty)
+    return _dumps(_build_all_data(include_oem), pretty)
 
 
 def export_json(filepath: str, include_oem: bool = False, pretty: bool = True) -> bool:
@@ -518,9 +833,13 @@ def export_json(filepath: str, include_oem: bool = False, pretty: bool = True) -
         True if export succeeded
     """
     try:
-        json_data = get_all_json(include_oem=include_oem, pretty=pretty)
-        with open(filepath, 'w') as f:
-            f.write(json_data)
+        cache_path = _disk_cache_path('all', include_oem, pretty)
+        if cache_path:
+            json_data = _cached_all_json(cache_path, include_oem, pretty)
+            with open(filepath, 'w') as f:
+                f.write(json_data)
+        else:
+            _dump_file(_build_all_data(include_oem), filepath, pretty)
         return True
     except Exception as e:
         logger.error(f"Failed to export JSON: {e}")
@@ -531,10 +850,196 @@ def export_json(filepath: str, include_oem: bool = False, pretty: bool = True) -
 # High-Level Query Functions
 # =============================================================================
 
+# Kernel-exported DMI identification strings, used as a fast path for the
+# system and BIOS parts of get_hardware_info() on live hardware
+_SYSFS_DMI_DIR = '/sys/class/dmi/id'
+
+_SYSFS_MAP = {
+    'system': {
+        'manufacturer': 'sys_vendor',
+        'product_name': 'product_name',
+        'serial_number': 'product_serial',
+        'uuid': 'product_uuid',
+    },
+    'bios': {
+        'vendor': 'bios_vendor',
+        'version': 'bios_version',
+        'release_date': 'bios_date',
+    },
+}
+
+
+# Decoder fields behind each get_hardware_info() section, see _decoded_section()
+_DECODER_MAP = {
+    'system': (DMI_TYPE_SYSTEM, {
+        'manufacturer': 'Manufacturer',
+        'product_name': 'Product Name',
+        'serial_number': 'Serial Number',
+        'uuid': 'UUID',
+    }),
+    'bios': (DMI_TYPE_BIOS, {
+        'vendor': 'Vendor',
+        'version': 'Version',
+        'release_date': 'Release Date',
+    }),
+}
+
+# Bogus SMBIOS 2.x versions corrected by both the kernel and the decoder
+_SMBIOS_VERSION_FIXUPS = {0x021F: 0x0203, 0x0221: 0x0203, 0x0233: 0x0206}
+
+
+def _read_sysfs(name: str) -> Optional[str]:
+    """
+    Read a single attribute from the kernel's DMI sysfs directory.
+
+    The value is trimmed the way the decoder trims DMI strings: trailing
+    blanks are dropped and "(null)" reads as an empty string.
+    """
+    try:
+        with open(os.path.join(_SYSFS_DMI_DIR, name), encoding='utf-8',
+                  errors='replace') as f:
+            value = f.read()
+    except OSError:
+        return None
+    value = value.rstrip('\n').rstrip(' ')
+    return '' if value == '(null)' else value
+
+
+def _smbios_versions() -> Optional[Tuple[int, int]]:
+    """
+    Read the SMBIOS version from the kernel's copy of the entry point.
+
+    Returns:
+        Tuple of the version as the kernel uses it (0xMMmmrr) and as the
+        decoder passes it to dmi_decode() (a u16, so for SMBIOS 3 the major
+        version is cut off), or None if the entry point cannot be read
+    """
+    try:
+        with open(os.path.join(_SYSFS_DMI_TABLES, 'smbios_entry_point'), 'rb') as f:
+            buf = f.read(0x20)
+    except OSError:
+        return None
+
+    if buf[:5] == b'_SM3_' and len(buf) >= 10:
+        version = (buf[7] << 16) | (buf[8] << 8) | buf[9]
+        return version, version & 0xFFFF
+    if buf[:4] == b'_SM_' and len(buf) >= 8:
+        version = (buf[6] << 8) | buf[7]
+        version = _SMBIOS_VERSION_FIXUPS.get(version, version)
+        return version << 8, version
+    if buf[:5] == b'_DMI_' and len(buf) >= 15:
+        version = ((buf[14] & 0xF0) << 4) | (buf[14] & 0x0F)
+        return version << 8, version
+    return None
+
+
+def _decoder_uuid(uuid: str, versions: Tuple[int, int]) -> Optional[str]:
+    """
+    Convert the kernel's product_uuid to the decoder's notation.
+
+    From SMBIOS 2.6 on, both print the first three UUID fields
+    little-endian, and the decoder prints them in upper case.  Each side
+    compares its own version number (see _smbios_versions()), so the byte
+    order may need to be swapped as well.
+    """
+    kernel_version, decoder_version = versions
+    fields = uuid.split('-')
+    if [len(field) for field in fields] != [8, 4, 4, 4, 12]:
+        return None
+    if (kernel_version >= 0x020600) != (decoder_version >= 0x0206):
+        for i in range(3):
+            fields[i] = ''.join(reversed([fields[i][j:j + 2]
+                                          for j in range(0, len(fields[i]), 2)]))
+    uuid = '-'.join(fields)
+    return uuid.upper() if decoder_version >= 0x0206 else uuid.lower()
+
+
+def _sysfs_section(section: str) -> Optional[Dict[str, str]]:
+    """
+    Read a get_hardware_info() section from sysfs.
+
+    Args:
+        section: Key in _SYSFS_MAP ('system' or 'bios')
+
+    Returns:
+        Dictionary with the section fields, or None if sysfs cannot be used
+    """
+    # sysfs describes the running machine, not a dump file set with set_dev()
+    if _dump_file_selected:
+        return None
+
+    result = {}
+    for key, name in _SYSFS_MAP[section].items():
+        value = _read_sysfs(name)
+        if value is None:
+            return None
+        result[key] = value
+
+    if 'uuid' in result:
+        versions = _smbios_versions()
+        if versions is None:
+            return None
+        result['uuid'] = _decoder_uuid(result['uuid'], versions)
+        if result['uuid'] is None:
+            return None
+    return result
+
+
+def _decoded_section(section: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode a get_hardware_info() section from the SMBIOS tables.
+
+    Args:
+        section: Key in _DECODER_MAP ('system' or 'bios')
+
+    Returns:
+        Dictionary with the fields of the first matching entry, or None if
+        there is no such entry
+    """
+    type_id, fields = _DECODER_MAP[section]
+    entries = _type_entries(type_id)
+    if not entries:
+        return None
+    data = entries[0]
+    return {key: data.get(name, 'Unknown') for key, name in fields.items()}
+
+
+# Memory device sizes as printed by the decoder, e.g. "8192 MB" or "16 GB"
+_SIZE_RE = re.compile(r'(\d+)\s*([MGT])B')
+_UNIT_MB = {'M': 1, 'G': 1024, 'T': 1024 * 1024}
+
+
+def _size_to_mb(size: str) -> int:
+    """Convert a memory device size string to megabytes (0 if unparsable)."""
+    match = _SIZE_RE.search(size)
+    if match is None:
+        return 0
+    return int(match.group(1)) * _UNIT_MB[match.group(2)]
+
+
+def _type_entries(type_id: int) -> List[Dict]:
+    """
+    Get the 'data' dictionaries of all entries of one DMI type.
+
+    Args:
+        type_id: DMI type ID
+
+    Returns:
+        List of the entries' data dictionaries, in SMBIOS table order
+    """
+    entries = _query_type(type_id)
+    return [entry.get('data', {}) for entry in _decode_bytes(entries).values()
+            if isinstance(entry, dict)]
+
+
 def get_hardware_info() -> Dict[str, Any]:
     """
     Get a summary of key hardware information.
 
+    On live hardware, system and BIOS details are read from
+    /sys/class/dmi/id when all the needed attributes are readable; otherwise
+    they are decoded from the SMBIOS tables.
+
     Returns:
         Dictionary with system, BIOS, processor, and memory information
     """
@@ -545,53 +1050,27 @@ def get_hardware_info() -> Dict[str, Any]:
         'memory': {}
     }
 
-    # System info
-    try:
-        system_data = QuerySection('system')
-        system_data = _decode_bytes(system_data)
-        for entry in system_data.values():
-            if isinstance(entry, dict) and entry.get('dmi_type') == 1:
-                data = entry.get('data', {})
-                info['system'] = {
-                    'manufacturer': data.get('Manufacturer', 'Unknown'),
-                    'product_name': data.get('Product Name', 'Unknown'),
-                    'serial_number': data.get('Serial Number', 'Unknown'),
-                    'uuid': data.get('UUID', 'Unknown'),
-                }
-                break
-    except Exception:
-        pass
-
-    # BIOS info
-    try:
-        bios_data = QuerySection('bios')
-        bios_data = _decode_bytes(bios_data)
-        for entry in bios_data.values():
-            if isinstance(entry, dict) and entry.get('dmi_type') == 0:
-                data = entry.get('data', {})
-                info['bios'] = {
-                    'vendor': data.get('Vendor', 'Unknown'),
-                    'version': data.get('Version', 'Unknown'),
-                    'release_date': data.get('Release Date', 'Unknown'),
-                }
-                break
-    except Exception:
-        pass
+    # System and BIOS info
+    for section in ('system', 'bios'):
+        data = _sysfs_section(section)
+        if data is None:
+            try:
+                data = _decoded_section(section)
+            except Exception:
+                pass
+        if data is not None:
+            info[section] = data
 
     # Processor info
     try:
-        proc_data = QuerySection('processor')
-        proc_data = _decode_bytes(proc_data)
         processors = []
-        for entry in proc_data.values():
-            if isinstance(entry, dict) and entry.get('dmi_type') == 4:
-                data = entry.get('data', {})
-                processors.append({
-                    'version': data.get('Version', 'Unknown'),
-                    'manufacturer': data.get('Manufacturer', 'Unknown'),
-                    'max_speed': data.get('Max Speed', 'Unknown'),
-                    'current_speed': data.get('Current Speed', 'Unknown'),
-                })
+        for data in _type_entries(DMI_TYPE_PROCESSOR):
+            processors.append({
+                'version': data.get('Version', 'Unknown'),
+                'manufacturer': data.get('Manufacturer', 'Unknown'),
+                'max_speed': data.get('Max Speed', 'Unknown'),
+                'current_speed': data.get('Current Speed', 'Unknown'),
+            })
         info['processor']['count'] = len(processors)
         if processors:
             info['processor']['details'] = processors
@@ -600,34 +1079,20 @@ def get_hardware_info() -> Dict[str, Any]:
 
     # Memory info
     try:
-        mem_data = QuerySection('memory')
-        mem_data = _decode_bytes(mem_data)
         total_size_mb = 0
         modules = []
-        for entry in mem_data.values():
-            if isinstance(entry, dict) and entry.get('dmi_type') == 17:
-                data = entry.get('data', {})
-                size_str = str(data.get('Size', ''))
-                size_mb = 0
-                if 'MB' in size_str:
-                    try:
-                        size_mb = int(size_str.split()[0])
-                    except (ValueError, IndexError):
-                        pass
-                elif 'GB' in size_str:
-                    try:
-                        size_mb = int(size_str.split()[0]) * 1024
-                    except (ValueError, IndexError):
-                        pass
-
-                if size_mb > 0:
-                    total_size_mb += size_mb
-                    modules.append({
-                        'size': size_str,
-                        'type': data.get('Type', 'Unknown'),
-                        'speed': data.get('Speed', 'Unknown'),
-                        'manufacturer': data.get('Manufacturer', 'Unknown'),
-                    })
+        for data in _type_entries(DMI_TYPE_MEMORY_DEVICE):
+            size_str = str(data.get('Size', ''))
+            size_mb = _size_to_mb(size_str)
+
+            if size_mb > 0:
+                total_size_mb += size_mb
+                modules.append({
+                    'size': size_str,
+                    'type': data.get('Type', 'Unknown'),
+                    'speed': data.get('Speed', 'Unknown'),
+                    'manufacturer': data.get('Manufacturer', 'Unknown'),
+                })
 
         if total_size_mb >= 1024:
             info['memory']['total'] = f"{total_size_mb / 1024:.1f} GB"
@@ -649,15 +1114,11 @@ def get_oem_types() -> Dict[int, Dict]:
     Returns:
         Dictionary mapping type IDs to their data
     """
-    oem_data = {}
-    for type_id in range(128, 256):
-        try:
-            data = query_oem_type(type_id)
-            if data:
-                oem_data[type_id] = data
-        except Exception:
-            pass
-    return oem_data
+    return {
+        type_id: _decode_bytes(data)
+        for type_id, data in _query_all_types().items()
+        if type_id >= 128
+    }
 
 
 def list_available_types() -> Dict[str, List[int]]:
@@ -667,27 +1128,8 @@ def list_available_types() -> Dict[str, List[int]]:
     Returns:
         Dictionary with 'standard' and 'oem' lists of type IDs
     """
-    available = {
-        'standard': [],
-        'oem': []
+    found = _query_all_types()
+    return {
+        'standard': [type_id for type_id in found if type_id < 128],
+        'oem': [type_id for type_id in found if type_id >= 128],
     }
-
-    # Check standard types
-    for type_id in range(128):
-        try:
-            data = QueryTypeId(type_id)
-            if data:
-                available['standard'].append(type_id)
-        except Exception:
-            pass
-
-    # Check OEM types
-    for type_id in range(128, 256):
-        try:
-            data = query_oem_type(type_id)
-            if data:
-                available['oem'].append(type_id)
-        except Exception:
-            pass
-
-    return available
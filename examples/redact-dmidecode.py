@@ -23,34 +23,48 @@ Usage:
     cat dmidecode_output.txt | python redact_dmidecode.py
 """
 
-SENSITIVE_PATTERNS = [
-    r'(Serial Number):\s*.+',
-    r'(Product Name):\s*.+',
-    r'(Asset Tag):\s*.+',
-    r'(UUID):\s*.+',
-    r'(SKU Number):\s*.+',
-    r'(Part Number):\s*.+',  # Often sensitive in memory devices
+SENSITIVE_FIELDS = [
+    'Serial Number',
+    'Product Name',
+    'Asset Tag',
+    'UUID',
+    'SKU Number',
+    'Part Number',  # Often sensitive in memory devices
 ]
 
-COMPILED_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in SENSITIVE_PATTERNS]
+# One alternation of all fields, so a line is searched and redacted in a
+# single pass; group 1 is the field name as written in the line
+COMBINED_PATTERN = re.compile(rf"({'|'.join(SENSITIVE_FIELDS)}):\s*.+", re.IGNORECASE)
+
+# Whole lines naming a sensitive field, used to find the lines worth passing
+# to redact_line() in one scan over the full text
+SENSITIVE_LINE_PATTERN = re.compile(
+    rf"^.*(?:{'|'.join(SENSITIVE_FIELDS)}):.*\n?", re.IGNORECASE | re.MULTILINE
+)
+
+def _redact_value(match):
+    return f"{match.group(1)}: [REDACTED]"
 
 def redact_line(line: str) -> str:
     """
     Redact sensitive values in a single line if it matches any pattern.
     Only replaces the value part after the colon.
     """
-    for pattern in COMPILED_PATTERNS:
-        def repl(match):
-            key = match.group(1)
-            return f"{key}: [REDACTED]"
-        
-        new_line = pattern.sub(repl, line.strip())
-        if new_line != line.strip():
-            # Re-add original indentation
-            indent = line[:len(line) - len(line.lstrip())]
-            return indent + new_line + '\n'
+    stripped = line.strip()
+    new_line = COMBINED_PATTERN.sub(_redact_value, stripped)
+    if new_line != stripped:
+        # Re-add original indentation
+        indent = line[:len(line) - len(line.lstrip())]
+        return indent + new_line + '\n'
     return line
 
+def redact_text(text: str) -> str:
+    """
+    Redact a whole dmidecode output at once.
+    Gives the same result as calling redact_line() on every line.
+    """
+    return SENSITIVE_LINE_PATTERN.sub(lambda match: redact_line(match.group(0)), text)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Redact sensitive information (serial numbers, UUIDs, etc.) from dmidecode output."
@@ -72,9 +86,7 @@ def main():
     args = parser.parse_args()
     
     with args.input_file as infile, args.output as outfile:
-        for line in infile:
-            redacted = redact_line(line)
-            outfile.write(redacted)
+        outfile.write(redact_text(infile.read()))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,9 +5,10 @@ Test script for the enhanced dmidecode Python module.
 This script tests all new features:
 - DMI type constants and mappings
 - Type detection helper functions
-- JSON export functionality
+- JSON export functionality and its on-disk cache
 - OEM type handling with raw data fallback
 - High-level query functions
+- QueryAllTypes() and query result caching
 
 Usage:
     # Run as root for full functionality
@@ -21,15 +22,31 @@ Usage:
     python3 test_dmidecode_features.py --test json
     python3 test_dmidecode_features.py --test oem
 
+    # Only print counts and PASS/FAIL lines, skip per-entry details
+    DMI_TEST_VERBOSE=0 python3 test_dmidecode_features.py --dump-file dmidata.dump
+
 Compatible with Python 3.9+
 """
 
 import argparse
-import json
+import itertools
 import os
 import sys
 import tempfile
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Per-entry detail output (handles, type names, field previews); set
+# DMI_TEST_VERBOSE=0 to skip formatting it, e.g. in CI
+VERBOSE = os.environ.get('DMI_TEST_VERBOSE', '1') != '0'
+
+# Sample DMI dumps shipped with the source tree
+BUNDLED_DUMP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'unit-tests', 'private')
+
 
 def print_header(title):
     """Print a formatted section header."""
@@ -45,6 +62,20 @@ def print_subheader(title):
     print(f"--- {title} ---")
 
 
+def save_dev():
+    """Remember the dump file in use, or None when reading the live tables."""
+    import dmidecode
+    return dmidecode.get_dev() if dmidecode._dump_file_selected else None
+
+
+def restore_dev(dump_file):
+    """Return to the data source remembered by save_dev()."""
+    import dmidecode
+    # get_dev() may be /sys/firmware/dmi/tables/DMI on live EFI systems, which
+    # set_dev() would read as a dump file; /dev/mem selects live mode
+    dmidecode.set_dev(dump_file if dump_file is not None else '/dev/mem')
+
+
 def test_module_import():
     """Test that the module imports correctly."""
     print_header("TEST: Module Import")
@@ -146,12 +177,14 @@ def test_query_section():
             if data:
                 results[section] = data
                 print(f"  Retrieved {len(data)} entries")
-                for handle, entry in list(data.items())[:2]:  # Show first 2
+                if not VERBOSE:
+                    continue
+                for handle, entry in itertools.islice(data.items(), 2):  # Show first 2
                     if isinstance(entry, dict):
                         print(f"    Handle: {handle}")
                         print(f"    Type: {entry.get('dmi_type', 'N/A')}")
                         if 'data' in entry:
-                            data_keys = list(entry['data'].keys())[:3]
+                            data_keys = list(itertools.islice(entry['data'], 3))
                             print(f"    Data keys: {data_keys}...")
             else:
                 print(f"  No data available")
@@ -179,11 +212,13 @@ def test_query_type():
             if data:
                 results[type_id] = data
                 print(f"  Retrieved {len(data)} entries")
-                for handle in list(data.keys())[:1]:  # Show first entry
+                if not VERBOSE:
+                    continue
+                for handle in itertools.islice(data, 1):  # Show first entry
                     entry = data[handle]
                     if isinstance(entry, dict) and 'data' in entry:
                         print(f"    Handle: {handle}")
-                        for key, value in list(entry['data'].items())[:3]:
+                        for key, value in itertools.islice(entry['data'].items(), 3):
                             print(f"    {key}: {value}")
             else:
                 print(f"  No data available")
@@ -208,18 +243,34 @@ def test_query_type_with_fallback():
         print(f"  No data available")
 
     print_subheader("OEM Type Range Check")
+    all_pass = True
     oem_found = 0
-    for type_id in range(128, 140):
+    # Probe the OEM types that are present, plus one that is not
+    present = [t for t in dmidecode.list_available_types()['oem'] if t < 140]
+    absent = next((t for t in range(128, 140) if t not in present), None)
+    # Drop the cached table so each probe decodes its type on its own
+    dmidecode.invalidate_dmi_cache()
+    for type_id in present:
         data = dmidecode.query_type_with_fallback(type_id)
         if data:
             oem_found += 1
             print(f"  Type {type_id}: Found {len(data)} entries")
+        else:
+            all_pass = False
+            print(f"  Type {type_id}: listed as present but no data returned [FAIL]")
 
     if oem_found == 0:
         print(f"  No OEM types found in range 128-139")
 
+    if absent is not None:
+        result = dmidecode.query_type_with_fallback(absent)
+        if result is not None:
+            all_pass = False
+        print(f"  query_type_with_fallback({absent}) = {result} (expected None) "
+              f"[{'PASS' if result is None else 'FAIL'}]")
+
     dmidecode.clear_warnings()
-    return True
+    return all_pass
 
 
 def test_json_export():
@@ -231,7 +282,7 @@ def test_json_export():
     print_subheader("get_section_json('bios')")
     try:
         json_str = dmidecode.get_section_json('bios', pretty=True)
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         print(f"  JSON valid: True")
         print(f"  Entries: {len(data)}")
         print(f"  Preview: {json_str[:200]}...")
@@ -241,7 +292,7 @@ def test_json_export():
     print_subheader("get_type_json(4)")
     try:
         json_str = dmidecode.get_type_json(4, pretty=True)
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         print(f"  JSON valid: True")
         print(f"  Entries: {len(data)}")
     except Exception as e:
@@ -250,7 +301,7 @@ def test_json_export():
     print_subheader("get_all_json()")
     try:
         json_str = dmidecode.get_all_json(include_oem=False, pretty=False)
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         print(f"  JSON valid: True")
         print(f"  Sections: {list(data.get('sections', {}).keys())}")
         print(f"  Types found: {len(data.get('types', {}))}")
@@ -264,19 +315,107 @@ def test_json_export():
 
         success = dmidecode.export_json(temp_path, include_oem=False, pretty=True)
         if success:
-            with open(temp_path, 'r') as f:
-                content = f.read()
-            data = json.loads(content)
+            with open(temp_path, 'rb') as f:
+                data = json_loads(f.read())
             print(f"  Export successful: True")
-            print(f"  File size: {len(content)} bytes")
+            print(f"  File size: {os.path.getsize(temp_path)} bytes")
             os.unlink(temp_path)
         else:
             print(f"  Export failed")
     except Exception as e:
         print(f"  Error: {e}")
 
+    print_subheader("orjson vs json module output")
+    same_text = True
+    if dmidecode.orjson is None:
+        print("  orjson not installed, skipping")
+    else:
+        try:
+            data = dmidecode._build_all_data(include_oem=True)
+            data['sample'] = 'Non-ASCII: é€, "quoted"\t\x01'
+            data = dmidecode._prepare_for_json(data)
+            for pretty in (False, True):
+                with_orjson = dmidecode._dumps(data, pretty)
+                saved_orjson = dmidecode.orjson
+                dmidecode.orjson = None
+                try:
+                    with_json = dmidecode._dumps(data, pretty)
+                finally:
+                    dmidecode.orjson = saved_orjson
+                result = with_orjson == with_json
+                same_text = same_text and result
+                print(f"  Same text (pretty={pretty}): [{'PASS' if result else 'FAIL'}]")
+        except Exception as e:
+            print(f"  Error: {e}")
+            same_text = False
+
+    dmidecode.clear_warnings()
+    return same_text
+
+
+def test_disk_cache():
+    """Test the opt-in on-disk cache of get_all_json()."""
+    print_header("TEST: JSON Disk Cache")
+
+    import dmidecode
+
+    dump_a = os.path.join(BUNDLED_DUMP_DIR, 'kvm-QEMU.0.dmidump')
+    dump_b = os.path.join(BUNDLED_DUMP_DIR, 'VMware-Virtual-Platform.0.dmidump')
+    if not (os.path.isfile(dump_a) and os.path.isfile(dump_b)):
+        print(f"  Bundled dumps not found in {BUNDLED_DUMP_DIR}, skipping")
+        return True
+
+    saved_env = {k: os.environ.get(k) for k in ('DMIDECODE_DISK_CACHE', 'XDG_CACHE_HOME')}
+    saved_dev = save_dev()
+    checks = []
+
+    def check(name, result):
+        checks.append(result)
+        print(f"  {name}: [{'PASS' if result else 'FAIL'}]")
+
+    try:
+        with tempfile.TemporaryDirectory() as cache_home:
+            os.environ['DMIDECODE_DISK_CACHE'] = '1'
+            os.environ['XDG_CACHE_HOME'] = cache_home
+            cache_dir = os.path.join(cache_home, 'python-dmidecode')
+            dmidecode.set_dev(dump_a)
+
+            print_subheader("Cache miss")
+            first = dmidecode.get_all_json()
+            files = os.listdir(cache_dir) if os.path.isdir(cache_dir) else []
+            check('Miss stores one cache file', len(files) == 1)
+            check('Miss returns valid JSON', bool(json_loads(first)))
+
+            print_subheader("Cache hit")
+            # Replace the cached document so a hit is distinguishable
+            marker = '{"cached": true}'
+            with open(os.path.join(cache_dir, files[0]), 'w') as f:
+                f.write(marker)
+            check('get_all_json() reads the cache', dmidecode.get_all_json() == marker)
+            with tempfile.NamedTemporaryFile(mode='r', suffix='.json') as f:
+                dmidecode.export_json(f.name, pretty=False)
+                check('export_json() reads the cache', f.read() == marker)
+
+            print_subheader("Cache key change")
+            dmidecode.set_dev(dump_b)
+            other = dmidecode.get_all_json()
+            check('Other dump misses the cache', other != marker)
+            check('Other dump stores its own file', len(os.listdir(cache_dir)) == 2)
+            pretty = dmidecode.get_all_json(pretty=True)
+            check('Options are part of the key', pretty != other)
+    except Exception as e:
+        print(f"  Error: {e}")
+        check('No exception', False)
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        restore_dev(saved_dev)
+
     dmidecode.clear_warnings()
-    return True
+    return all(checks)
 
 
 def test_oem_types():
@@ -286,34 +425,51 @@ def test_oem_types():
     import dmidecode
 
     print_subheader("Scanning OEM Types (128-255)")
-    oem_data = {}
+    # One pass over the DMI table instead of probing each type id
+    error = None
+    try:
+        all_oem = dmidecode.get_oem_types()
+    except Exception as e:
+        all_oem = {}
+        error = e
 
-    for type_id in range(128, 256):
-        try:
-            data = dmidecode.query_oem_type(type_id)
-            if data:
-                oem_data[type_id] = data
-                type_name = dmidecode.get_type_name(type_id)
-                print(f"  Type {type_id} ({type_name}): {len(data)} entries")
-        except Exception:
-            pass
+    all_pass = True
+    for type_id, expected in all_oem.items():
+        data = dmidecode.query_oem_type(type_id)
+        if data != expected:
+            all_pass = False
+            print(f"  Type {type_id}: query_oem_type() differs from get_oem_types() [FAIL]")
+        elif VERBOSE:
+            type_name = dmidecode.get_type_name(type_id)
+            print(f"  Type {type_id} ({type_name}): {len(data)} entries")
 
-    if not oem_data:
+    if not all_oem:
         print(f"  No OEM types found on this system")
     else:
-        print(f"\n  Total OEM types found: {len(oem_data)}")
+        print(f"\n  Total OEM types found: {len(all_oem)}")
 
     print_subheader("get_oem_types() function")
-    try:
-        all_oem = dmidecode.get_oem_types()
+    if error is None:
         print(f"  OEM types returned: {len(all_oem)}")
-        for type_id in list(all_oem.keys())[:3]:
+        for type_id in itertools.islice(all_oem, 3):
             print(f"    Type {type_id}: {len(all_oem[type_id])} entries")
-    except Exception as e:
-        print(f"  Error: {e}")
+    else:
+        print(f"  Error: {error}")
+        all_pass = False
+
+    print_subheader("Absent OEM Type")
+    absent = next((t for t in range(255, 127, -1) if t not in all_oem), None)
+    if absent is None:
+        print(f"  All OEM types are present, nothing to check")
+    else:
+        result = dmidecode.query_oem_type(absent)
+        if result is not None:
+            all_pass = False
+        print(f"  query_oem_type({absent}) = {result} (expected None) "
+              f"[{'PASS' if result is None else 'FAIL'}]")
 
     dmidecode.clear_warnings()
-    return True
+    return all_pass
 
 
 def test_hardware_info():
@@ -353,6 +509,124 @@ def test_hardware_info():
         dmidecode.clear_warnings()
 
 
+def write_fake_sysfs(root, decoded, kernel_uuid, entry_point):
+    """
+    Lay out /sys/class/dmi/id and /sys/firmware/dmi/tables under root the way
+    the kernel exports the given decoded record.  Strings get trailing blanks
+    and a newline, as the kernel keeps the blanks the decoder trims.
+    """
+    import dmidecode
+
+    id_dir = os.path.join(root, 'id')
+    tables_dir = os.path.join(root, 'tables')
+    os.makedirs(id_dir)
+    os.makedirs(tables_dir)
+    for section, attributes in dmidecode._SYSFS_MAP.items():
+        for key, name in attributes.items():
+            value = kernel_uuid if key == 'uuid' else f"{decoded[section][key]}  "
+            with open(os.path.join(id_dir, name), 'w') as f:
+                f.write(f"{value}\n")
+    with open(os.path.join(tables_dir, 'smbios_entry_point'), 'wb') as f:
+        f.write(entry_point)
+    return id_dir, tables_dir
+
+
+def read_fake_sysfs(id_dir, tables_dir):
+    """Run the sysfs fast path of get_hardware_info() against a fake sysfs tree."""
+    import dmidecode
+
+    saved = (dmidecode._SYSFS_DMI_DIR, dmidecode._SYSFS_DMI_TABLES,
+             dmidecode._dump_file_selected)
+    dmidecode._SYSFS_DMI_DIR = id_dir
+    dmidecode._SYSFS_DMI_TABLES = tables_dir
+    dmidecode._dump_file_selected = False
+    try:
+        return {section: dmidecode._sysfs_section(section)
+                for section in dmidecode._SYSFS_MAP}
+    finally:
+        (dmidecode._SYSFS_DMI_DIR, dmidecode._SYSFS_DMI_TABLES,
+         dmidecode._dump_file_selected) = saved
+
+
+def test_sysfs_fast_path():
+    """Test that the sysfs fast path returns what the decoder returns."""
+    print_header("TEST: Hardware Info from sysfs")
+
+    import dmidecode
+
+    checks = []
+
+    def check(name, result):
+        checks.append(result)
+        print(f"  {name}: [{'PASS' if result else 'FAIL'}]")
+
+    def decoded_sections():
+        return {section: dmidecode._decoded_section(section)
+                for section in dmidecode._SYSFS_MAP}
+
+    print_subheader("Live sysfs vs decoder")
+    live = {section: dmidecode._sysfs_section(section) for section in dmidecode._SYSFS_MAP}
+    if all(live.values()):
+        for section, value in live.items():
+            check(f"{section} matches the decoder", value == dmidecode._decoded_section(section))
+    else:
+        print("  sysfs not in use (dump file or unreadable attributes), skipping")
+
+    dump = os.path.join(BUNDLED_DUMP_DIR, 'Parallels-Virtual-Platform.0.dmidump')
+    if not os.path.isfile(dump):
+        print(f"  Bundled dumps not found in {BUNDLED_DUMP_DIR}, skipping")
+        dmidecode.clear_warnings()
+        return all(checks)
+
+    saved_dev = save_dev()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(dump, 'rb') as f:
+                raw = bytearray(f.read())
+
+            print_subheader("SMBIOS 2.3 dump")
+            dmidecode.set_dev(dump)
+            decoded = decoded_sections()
+            dirs = write_fake_sysfs(os.path.join(tmp, 'v23'), decoded,
+                                    decoded['system']['uuid'].lower(), bytes(raw[:0x20]))
+            for section, value in read_fake_sysfs(*dirs).items():
+                check(f"{section} matches the decoder", value == decoded[section])
+
+            print_subheader("Same dump as SMBIOS 2.6")
+            # Bump the entry point to 2.6 and fix its checksum
+            raw[4] = (raw[4] - (6 - raw[7])) & 0xFF
+            raw[7] = 6
+            patched = os.path.join(tmp, 'v26.dmidump')
+            with open(patched, 'wb') as f:
+                f.write(raw)
+            dmidecode.set_dev(patched)
+            decoded = decoded_sections()
+            check("Decoder prints the UUID in upper case",
+                  decoded['system']['uuid'] == decoded['system']['uuid'].upper())
+            dirs = write_fake_sysfs(os.path.join(tmp, 'v26'), decoded,
+                                    decoded['system']['uuid'].lower(), bytes(raw[:0x20]))
+            for section, value in read_fake_sysfs(*dirs).items():
+                check(f"{section} matches the decoder", value == decoded[section])
+
+            print_subheader("SMBIOS 3.2 entry point")
+            # The kernel prints 3.2 UUIDs little-endian, the decoder compares
+            # the truncated version 0x0200 and prints the raw byte order
+            entry_point = b'_SM3_' + bytes([0, 0x18, 3, 2, 0]) + bytes(14)
+            dirs = write_fake_sysfs(os.path.join(tmp, 'v32'), decoded,
+                                    '00112233-4455-6677-8899-aabbccddeeff', entry_point)
+            system = read_fake_sysfs(*dirs)['system']
+            check("UUID in decoder notation",
+                  system is not None and system['uuid'] == '33221100-5544-7766-8899-aabbccddeeff')
+    except Exception as e:
+        print(f"  Error: {e}")
+        check('No exception', False)
+    finally:
+        restore_dev(saved_dev)
+
+    dmidecode.clear_warnings()
+    return all(checks)
+
+
 def test_list_available_types():
     """Test listing available DMI types."""
     print_header("TEST: List Available Types")
@@ -365,16 +639,16 @@ def test_list_available_types():
         print_subheader("Standard Types Found")
         standard = available.get('standard', [])
         print(f"  Count: {len(standard)}")
-        if standard:
-            type_names = [f"{t} ({dmidecode.get_type_name(t)})" for t in standard[:10]]
-            print(f"  Types: {', '.join(type_names)}...")
+        if standard and VERBOSE:
+            type_names = ', '.join(f"{t} ({dmidecode.get_type_name(t)})" for t in standard[:10])
+            print(f"  Types: {type_names}...")
 
         print_subheader("OEM Types Found")
         oem = available.get('oem', [])
         print(f"  Count: {len(oem)}")
-        if oem:
-            type_names = [f"{t} ({dmidecode.get_type_name(t)})" for t in oem[:5]]
-            print(f"  Types: {', '.join(type_names)}")
+        if oem and VERBOSE:
+            type_names = ', '.join(f"{t} ({dmidecode.get_type_name(t)})" for t in oem[:5])
+            print(f"  Types: {type_names}")
 
         return True
     except Exception as e:
@@ -390,11 +664,12 @@ def test_additional_features():
 
     import dmidecode
 
-    print_subheader("Type Name Lookup")
-    test_types = [0, 1, 4, 17, 127, 130, 200]
-    for type_id in test_types:
-        name = dmidecode.get_type_name(type_id)
-        print(f"  Type {type_id}: {name}")
+    if VERBOSE:
+        print_subheader("Type Name Lookup")
+        test_types = [0, 1, 4, 17, 127, 130, 200]
+        for type_id in test_types:
+            name = dmidecode.get_type_name(type_id)
+            print(f"  Type {type_id}: {name}")
 
     print_subheader("Type Category Checks")
     checks = [
@@ -408,8 +683,71 @@ def test_additional_features():
     print_subheader("DMI Sections")
     print(f"  Available sections: {list(dmidecode.DMI_SECTIONS.keys())}")
 
+    all_pass = True
+
+    print_subheader("QueryAllTypes() vs QueryTypeId()")
+    try:
+        all_types = dmidecode.QueryAllTypes()
+        per_type = {}
+        for type_id in range(256):
+            try:
+                data = dmidecode.QueryTypeId(type_id)
+            except Exception:
+                data = None
+            if data:
+                per_type[type_id] = data
+        checks = [
+            ('Same type IDs', sorted(all_types) == sorted(per_type)),
+            ('Same data', all_types == per_type),
+        ]
+        # Results are copies; changing one must not affect the next call
+        all_types.clear()
+        checks.append(('Result is a copy', dmidecode.QueryAllTypes() == per_type))
+    except Exception as e:
+        print(f"  Error: {e}")
+        per_type = None
+        checks = []
+        all_pass = False
+    for check_name, result in checks:
+        if not result:
+            all_pass = False
+        print(f"  {check_name}: [{'PASS' if result else 'FAIL'}]")
+    if per_type is not None:
+        print(f"  Types found: {len(per_type)}")
+
+    print_subheader("Query Cache Reset")
+    cache = dmidecode._cached_query_all_types
+    checks = []
+    dmidecode.QueryAllTypes()
+    dmidecode.invalidate_dmi_cache()
+    checks.append(('invalidate_dmi_cache() empties the cache', cache.cache_info().currsize == 0))
+    if per_type is not None:
+        checks.append(('Data decoded again is unchanged', dmidecode.QueryAllTypes() == per_type))
+
+    # Switch to a bundled dump and back; set_dev() must drop the cache each time
+    other_dump = os.path.join(BUNDLED_DUMP_DIR, 'kvm-QEMU.0.dmidump')
+    if os.path.isfile(other_dump):
+        saved_dev = save_dev()
+        try:
+            dmidecode.QueryAllTypes()
+            dmidecode.set_dev(other_dump)
+            checks.append(('set_dev() empties the cache', cache.cache_info().currsize == 0))
+            dmidecode.QueryAllTypes()
+        finally:
+            restore_dev(saved_dev)
+        checks.append(('Restoring the device empties the cache', cache.cache_info().currsize == 0))
+        if per_type is not None:
+            checks.append(('Restored device decodes the same data',
+                           dmidecode.QueryAllTypes() == per_type))
+    else:
+        print(f"  Bundled dumps not found in {BUNDLED_DUMP_DIR}, skipping set_dev() check")
+    for check_name, result in checks:
+        if not result:
+            all_pass = False
+        print(f"  {check_name}: [{'PASS' if result else 'FAIL'}]")
+
     dmidecode.clear_warnings()
-    return True
+    return all_pass
 
 
 def run_all_tests(dump_file=None):
@@ -419,7 +757,9 @@ def run_all_tests(dump_file=None):
     # Set dump file if provided
     if dump_file:
         print(f"\nUsing dump file: {dump_file}")
-        dmidecode.set_dev(dump_file)
+        # main() may already have selected it; set_dev() drops cached data
+        if dmidecode.get_dev() != dump_file:
+            dmidecode.set_dev(dump_file)
 
     tests = [
         ("Module Import", test_module_import),
@@ -428,8 +768,10 @@ def run_all_tests(dump_file=None):
         ("Query Type", test_query_type),
         ("Query with Fallback", test_query_type_with_fallback),
         ("JSON Export", test_json_export),
+        ("JSON Disk Cache", test_disk_cache),
         ("OEM Types", test_oem_types),
         ("Hardware Info", test_hardware_info),
+        ("Hardware Info from sysfs", test_sysfs_fast_path),
         ("List Available Types", test_list_available_types),
         ("Additional Features", test_additional_features),
     ]
@@ -447,12 +789,10 @@ def run_all_tests(dump_file=None):
     passed = sum(1 for v in results.values() if v)
     total = len(results)
 
-    for name, result in results.items():
-        status = "PASS" if result else "FAIL"
-        print(f"  {name}: {status}")
-
-    print()
-    print(f"  Total: {passed}/{total} tests passed")
+    report = "\n".join(
+        f"  {name}: {'PASS' if result else 'FAIL'}" for name, result in results.items()
+    )
+    print(f"{report}\n\n  Total: {passed}/{total} tests passed")
 
     return all(results.values())
 
@@ -477,7 +817,7 @@ Examples:
 
     parser.add_argument(
         '--test',
-        choices=['constants', 'section', 'type', 'json', 'oem', 'hwinfo', 'features', 'all'],
+        choices=['constants', 'section', 'type', 'json', 'cache', 'oem', 'hwinfo', 'sysfs', 'features', 'all'],
         default='all',
         help='Run specific test (default: all)'
     )
@@ -492,7 +832,9 @@ Examples:
     # Import and set dump file
     import dmidecode
     if args.dump_file:
-        if not os.path.exists(args.dump_file):
+        try:
+            os.stat(args.dump_file)
+        except OSError:
             print(f"Error: Dump file not found: {args.dump_file}")
             sys.exit(1)
         dmidecode.set_dev(args.dump_file)
@@ -503,8 +845,10 @@ Examples:
         'section': test_query_section,
         'type': test_query_type,
         'json': test_json_export,
+        'cache': test_disk_cache,
         'oem': test_oem_types,
         'hwinfo': test_hardware_info,
+        'sysfs': test_sysfs_fast_path,
         'features': test_additional_features,
         'all': lambda: run_all_tests(args.dump_file),
     }
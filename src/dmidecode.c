@@ -228,35 +228,49 @@ static int dmi_bcd_range(u8 value, u8 low, u8 high)
 
 void dmi_dump(xmlNode *node, struct dmi_header * h)
 {
+        static const char hexdigits[] = "0123456789abcdef";
         int row, i;
-        const char *s;
+        char *s;
+        size_t len, j;
         xmlNode *dump_n = NULL, *row_n = NULL;
-        char *tmp_s = NULL;
+        char row_s[16 * 4 + 1];         /* 16 bytes per row, "0x%02x" each */
+        char *p = NULL;
+        u8 b;
 
         dump_n = xmlNewChild(node, NULL, (xmlChar *) "HeaderAndData", NULL);
         assert( dump_n != NULL );
 
-        tmp_s = (char *) malloc((h->length * 2) + 2);
         for(row = 0; row < ((h->length - 1) >> 4) + 1; row++) {
-                memset(tmp_s, 0, (h->length * 2) + 2);
-
+                p = row_s;
                 for(i = 0; i < 16 && (i < h->length - (row << 4)); i++) {
-                        snprintf(tmp_s + strlen(tmp_s), (h->length * 2)-strlen(tmp_s),
-                                 "0x%02x", (h->data)[(row << 4) + i]);
-                }
-                row_n = dmixml_AddTextChild(dump_n, "Row", "%s", tmp_s);
+                        b = (h->data)[(row << 4) + i];
+                        *p++ = '0';
+                        *p++ = 'x';
+                        *p++ = hexdigits[b >> 4];
+                        *p++ = hexdigits[b & 0x0f];
+                }
+                *p = '\0';
+                row_n = dmixml_AddTextChild(dump_n, "Row", "%s", row_s);
                 dmixml_AddAttribute(row_n, "index", "%i", row);
                 row_n = NULL;
         }
-        free(tmp_s); tmp_s = NULL;
         dump_n = NULL;
 
         dump_n = xmlNewChild(node, NULL, (xmlChar *) "Strings", NULL);
         assert( dump_n != NULL );
 
         if((h->data)[h->length] || (h->data)[h->length + 1]) {
+                /* Walk the string set once; dmi_string() would rescan it from
+                 * the start for every index */
+                s = (char *)h->data + h->length;
                 i = 1;
-                while((s = dmi_string(h, i++)) != NULL) {
+                while(*s) {
+                        len = strlen(s);
+                        /* ASCII filtering, same as dmi_string() */
+                        for(j = 0; j < len; j++)
+                                if(s[j] < 32 || s[j] == 127)
+                                        s[j] = '.';
+                        i++;
                         //. FIXME: DUMP
                         /*
                          * opt->flags will need to be transported to the function somehow
@@ -275,6 +289,7 @@ void dmi_dump(xmlNode *node, struct dmi_header * h)
                         row_n = dmixml_AddTextChild(dump_n, "String", "%s", s);
                         dmixml_AddAttribute(row_n, "index", "%i", i);
                         row_n = NULL;
+                        s += len + 1;
                 }
         }
         dump_n = NULL;
@@ -6188,7 +6203,7 @@ static void dmi_table(Log_t *logp, int type, u32 base, u32 len, u16 num, u32 ver
                 }
                 next += 2;
                 xmlNode *handle_n = NULL;
-                if( h.type == type ) {
+                if( (h.type == type) || (type == DMI_TYPE_ALL) ) {
                         if(next - buf <= len) {
                                 dmi_codes_major *dmiMajor = NULL;
                                 /* TODO: ...
@@ -6231,7 +6246,7 @@ static void dmi_table(Log_t *logp, int type, u32 base, u32 len, u16 num, u32 ver
                 i++;
         }
 
-        if( decoding_done == 0 ) {
+        if( (decoding_done == 0) && (type != DMI_TYPE_ALL) ) {
                 xmlNode *handle_n = xmlNewChild(xmlnode, NULL, (xmlChar *) "DMImessage", NULL);
                 assert( handle_n != NULL );
                 dmixml_AddTextContent(handle_n, "DMI/SMBIOS type 0x%02X is not found on this hardware",
@@ -690,6 +690,136 @@ static PyObject *dmidecode_get_type(PyObject * self, PyObject * args)
         return pydata;
 }
 
+static PyObject *dmidecode_get_all_types(PyObject * self, PyObject * null)
+{
+        options *opt = global_options;
+        xmlNode *map_n = NULL;
+        xmlNode *typemap_n = NULL;
+        xmlNode *dmixml_n = NULL;
+        xmlNode *entry_n = NULL;
+        xmlNode *next_n = NULL;
+        xmlNode *types_n[256];
+        PyObject *pydata = NULL;
+        char mapped[256];
+        int typeid;
+
+        // Fetch the Mapping XML file
+        if( (map_n = load_mappingxml(opt)) == NULL ) {
+                // Exception already set
+                return NULL;
+        }
+
+        // Find the section in the XML containing the type mappings
+        if( (map_n = dmixml_FindNode(map_n, "TypeMapping")) == NULL ) {
+                PyReturnError(PyExc_LookupError,
+                              "Could not find the TypeMapping section in the XML mapping");
+        }
+
+        // Only types with a <TypeMap> can give any data, so the others are
+        // not converted
+        memset(&mapped, 0, sizeof(mapped));
+        foreach_xmlnode(dmixml_FindNode(map_n, "TypeMap"), typemap_n) {
+                char *id = NULL;
+
+                if( (typemap_n->type != XML_ELEMENT_NODE)
+                    || (xmlStrcmp(typemap_n->name, (xmlChar *) "TypeMap") != 0) ) {
+                        continue;
+                }
+                id = dmixml_GetAttrValue(typemap_n, "id");
+                if( id != NULL ) {
+                        typeid = (int) strtol(id, NULL, 0);
+                        if( (typeid >= 0) && (typeid <= 255) ) {
+                                mapped[typeid] = 1;
+                        }
+                }
+        }
+
+        // Decode the whole DMI table in one pass
+        if( (dmixml_n = __dmidecode_xml_gettypeid(opt, DMI_TYPE_ALL)) == NULL ) {
+                // Exception already set
+                return NULL;
+        }
+
+        // Move each decoded structure into a tree of its own type, laid out
+        // like the one QueryTypeId() would convert
+        memset(&types_n, 0, sizeof(types_n));
+        for( entry_n = dmixml_n->children; entry_n != NULL; entry_n = next_n ) {
+                char *id = NULL;
+                char *end = NULL;
+
+                next_n = entry_n->next;
+                if( (entry_n->type != XML_ELEMENT_NODE)
+                    || ((id = dmixml_GetAttrValue(entry_n, "type")) == NULL) ) {
+                        continue;
+                }
+                typeid = (int) strtol(id, &end, 10);
+                if( (end == id) || (*end != '\0') || (typeid < 0) || (typeid > 255)
+                    || !mapped[typeid] ) {
+                        continue;
+                }
+
+                if( types_n[typeid] == NULL ) {
+                        types_n[typeid] = xmlNewNode(NULL, (xmlChar *) "dmidecode");
+                        assert( types_n[typeid] != NULL );
+                        if( opt->dmiversion_n != NULL ) {
+                                xmlAddChild(types_n[typeid], xmlCopyNode(opt->dmiversion_n, 1));
+                        }
+                }
+                xmlUnlinkNode(entry_n);
+                xmlAddChild(types_n[typeid], entry_n);
+        }
+        xmlFreeNode(dmixml_n);
+
+        if( (pydata = PyDict_New()) == NULL ) {
+                goto exit_free;
+        }
+
+        for( typeid = 0; typeid <= 255; typeid++ ) {
+                ptzMAP *mapping = NULL;
+                PyObject *typedata = NULL;
+                PyObject *key = NULL;
+
+                if( types_n[typeid] == NULL ) {
+                        continue;
+                }
+
+                mapping = dmiMAP_ParseMappingXML_TypeID(opt->logdata, opt->mappingxml, typeid);
+                if( mapping == NULL ) {
+                        PyErr_Clear();
+                        continue;
+                }
+
+                // A type which fails to convert is left out, just like a type
+                // which is not present on this hardware
+                typedata = pythonizeXMLnode(opt->logdata, mapping, types_n[typeid]);
+                ptzmap_Free(mapping);
+                if( typedata == NULL ) {
+                        PyErr_Clear();
+                        continue;
+                }
+
+                if( PyDict_Check(typedata) && (PyDict_Size(typedata) > 0) ) {
+                        key = PYNUMBER_FROMLONG(typeid);
+                        if( (key == NULL) || (PyDict_SetItem(pydata, key, typedata) != 0) ) {
+                                Py_XDECREF(key);
+                                Py_DECREF(typedata);
+                                Py_CLEAR(pydata);
+                                goto exit_free;
+                        }
+                        Py_DECREF(key);
+                }
+                Py_DECREF(typedata);
+        }
+
+exit_free:
+        for( typeid = 0; typeid <= 255; typeid++ ) {
+                if( types_n[typeid] != NULL ) {
+                        xmlFreeNode(types_n[typeid]);
+                }
+        }
+        return pydata;
+}
+
 static PyObject *dmidecode_xmlapi(PyObject *self, PyObject *args, PyObject *keywds)
 {
         static char *keywordlist[] = {"query_type", "result_type", "section", "typeid", NULL};
@@ -933,6 +1063,11 @@ static PyMethodDef DMIDataMethods[] = {
          (char *) "Queries the DMI data structure for a specific DMI type."
         },
 
+        {(char *)"QueryAllTypes", dmidecode_get_all_types, METH_NOARGS,
+         (char *) "Queries the DMI data structure for all DMI types at once.  Returns a "
+         "dictionary keyed by type ID, containing only the types found."
+        },
+
         {(char *)"pythonmap", dmidecode_set_pythonxmlmap, METH_O,
          (char *) "Use another python dict map definition. The default file is " PYTHON_XML_MAP},
 